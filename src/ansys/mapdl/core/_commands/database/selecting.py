@@ -567,7 +567,7 @@ class Selecting:
         >>> mapdl.esel('S', 'MAT', vmin=2)
 
         """
-        command = f"ESEL,{type_},{item},{comp},{vmin},{vmax},{vinc},{kabs}"
+        command = f"ESEL,{type_},{item},{comp},{vmin},{vmax},{vinc},{kabs}".rstrip(",")
         return self.run(command, **kwargs)
 
     def esla(self, type_: str = "", **kwargs) -> Optional[str]:
@@ -22,7 +22,7 @@
 
 """These commands are used to parse responses from MAPDL"""
 import re
-from typing import Optional
+from typing import List, Optional
 
 NUMERIC_CONST_PATTERN = r"""
 [-+]? # optional sign
@@ -38,6 +38,9 @@ NUMERIC_CONST_PATTERN = r"""
 
 NUM_PATTERN = re.compile(NUMERIC_CONST_PATTERN, re.VERBOSE)
 
+ELEMENT_NUMBER_PATTERN = re.compile(r"ELEMENT\s*([0-9]+)")
+NODE_NUMBER_PATTERN = re.compile(r"NODE\s*([0-9]+)")
+
 
 def parse_kdist(msg: Optional[str] = None) -> Optional[int]:
     """Parse the keypoint value from a keypoint message"""
@@ -59,9 +62,15 @@ def parse_et(msg: Optional[str] = None) -> Optional[int]:
 def parse_e(msg: Optional[str] = None) -> Optional[int]:
     """Parse create element message and return element number."""
     if msg:
-        res = re.search(r"(ELEMENT\s*)([0-9]+)", msg)
+        res = ELEMENT_NUMBER_PATTERN.search(msg)
         if res is not None:
-            return int(res.group(2))
+            return int(res.group(1))
+
+
+def parse_e_many(msg: Optional[str] = None) -> Optional[List[int]]:
+    """Parse the output of several ``E`` commands and return the element numbers."""
+    if msg:
+        return list(map(int, ELEMENT_NUMBER_PATTERN.findall(msg)))
 
 
 def parse_k(msg: Optional[str] = None) -> Optional[int]:
@@ -137,9 +146,15 @@ def parse_output_volume_area(msg: Optional[str] = None) -> Optional[int]:
 def parse_n(msg: Optional[str] = None) -> Optional[int]:
     """Parse output of ``N``"""
     if msg:
-        res = re.search(r"(NODE\s*)([0-9]+)", msg)
+        res = NODE_NUMBER_PATTERN.search(msg)
         if res is not None:
-            return int(res.group(2))
+            return int(res.group(1))
+
+
+def parse_n_many(msg: Optional[str] = None) -> Optional[List[int]]:
+    """Parse the output of several ``N`` commands and return the node numbers."""
+    if msg:
+        return list(map(int, NODE_NUMBER_PATTERN.findall(msg)))
 
 
 def parse_ndist(msg: Optional[str] = None) -> Optional[int]:
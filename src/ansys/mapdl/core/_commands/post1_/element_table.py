@@ -132,7 +132,7 @@ class ElementTable:
         [PRNSOL] will be the same as with the full graphics mode
         [/GRAPHICS,FULL].
         """
-        command = f"ESORT,{item},{lab},{order},{kabs},{numb}"
+        command = f"ESORT,{item},{lab},{order},{kabs},{numb}".rstrip(",")
         return self.run(command, **kwargs)
 
     def etable(
@@ -140,7 +140,7 @@ class Elements:
         2
 
         """
-        command = f"E,{i},{j},{k},{l},{m},{n},{o},{p}"
+        command = f"E,{i},{j},{k},{l},{m},{n},{o},{p}".rstrip(",")
         return parse.parse_e(self.run(command, **kwargs))
 
     def ecpchg(self, **kwargs):
@@ -648,7 +648,7 @@ class Elements:
 
         This command is valid in any processor.
         """
-        command = f"ELIST,{iel1},{iel2},{inc},{nnkey},{rkey},{ptkey}"
+        command = f"ELIST,{iel1},{iel2},{inc},{nnkey},{rkey},{ptkey}".rstrip(",")
         return self.run(command, **kwargs)
 
     def emid(self, key="", edges="", **kwargs):
@@ -768,7 +768,9 @@ class Elements:
         >>> mapdl.emodif('ALL', 'MAT', 2)
 
         """
-        command = f"EMODIF,{iel},{stloc},{i1},{i2},{i3},{i4},{i5},{i6},{i7},{i8}"
+        command = (
+            f"EMODIF,{iel},{stloc},{i1},{i2},{i3},{i4},{i5},{i6},{i7},{i8}".rstrip(",")
+        )
         return self.run(command, **kwargs)
 
     def emore(
@@ -832,7 +834,7 @@ class Elements:
                    17 18 19 20
 
         """
-        command = f"EMORE,{q},{r},{s},{t},{u},{v},{w},{x}"
+        command = f"EMORE,{q},{r},{s},{t},{u},{v},{w},{x}".rstrip(",")
         return self.run(command, **kwargs)
 
     def emtgen(
@@ -991,7 +993,7 @@ class Elements:
         creation may fail before the :meth:`emore` command modifies
         the element into an acceptable shape.
         """
-        command = f"EN,{iel},{i},{j},{k},{l},{m},{n},{o},{p}"
+        command = f"EN,{iel},{i},{j},{k},{l},{m},{n},{o},{p}".rstrip(",")
         return self.run(command, **kwargs)
 
     def endrelease(self, tolerance="", dof1="", dof2="", dof3="", dof4="", **kwargs):
@@ -1123,7 +1125,7 @@ class Elements:
             f"ENGEN,{iinc},{itime},{ninc},{iel1},{iel2},"
             f"{ieinc},{minc},{tinc},{rinc},{cinc},{sinc},{dx},"
             f"{dy},{dz}"
-        )
+        ).rstrip(",")
         return self.run(command, **kwargs)
 
     def enorm(self, enum: Union[str, int] = "", **kwargs) -> Optional[str]:
@@ -1255,7 +1257,8 @@ class Elements:
         Revising Your Model in the Modeling and Meshing Guide for more
         information about controlling element normals.
         """
-        return self.run(f"ENSYM,{iinc},,{ninc},{iel1},{iel2},{ieinc}", **kwargs)
+        command = f"ENSYM,{iinc},,{ninc},{iel1},{iel2},{ieinc}".rstrip(",")
+        return self.run(command, **kwargs)
 
     def eplot(self, **kwargs):
         """Plots the currently selected elements.
@@ -1574,7 +1577,8 @@ class Elements:
         "symmetry" elements is possible. See also the ENSYM command
         for modifying existing elements.
         """
-        return self.run(f"ESYM,,{ninc},{iel1},{iel2},{ieinc}", **kwargs)
+        command = f"ESYM,,{ninc},{iel1},{iel2},{ieinc}".rstrip(",")
+        return self.run(command, **kwargs)
 
     def ewrite(
         self,
@@ -1636,7 +1640,8 @@ class Elements:
         >>> mapdl.ewrite('etable.txt', format_='LONG')
 
         """
-        return self.run(f"EWRITE,{fname},{ext},,{kappnd},{format_}", **kwargs)
+        command = f"EWRITE,{fname},{ext},,{kappnd},{format_}".rstrip(",")
+        return self.run(command, **kwargs)
 
     def gcdef(self, option="", sect1="", sect2="", matid="", realid="", **kwargs):
         """Defines interface interactions between general contact surfaces.
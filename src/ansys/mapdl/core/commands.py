@@ -257,8 +257,14 @@ def inject_after_return_section(indented_doc_inject: str, docstring: str) -> str
     )
 
 
-def inject_docs(docstring: str, docstring_injection: Optional[str] = None) -> str:
+def inject_docs(
+    docstring: Optional[str], docstring_injection: Optional[str] = None
+) -> Optional[str]:
     """Inject a string in a docstring"""
+    if not docstring:
+        # Docstrings are removed when running Python with ``-OO``.
+        return docstring
+
     if not docstring_injection:
         docstring_injection = CMD_DOCSTRING_INJECTION
 
@@ -20,10 +20,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from functools import cache
 from logging import Logger, StreamHandler
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from warnings import warn
 
 from ansys.mapdl.core import __version__
@@ -125,6 +136,33 @@ FORCED_MAPPING: Dict[str, str] = {
     "SECT": "sectype",  # Because it is shadowed by `sectinqr`
 }
 
+# Only parameters starting with one of these characters can be numbers.
+# Checking it first avoids calling ``float`` on labels such as ``ALL``.
+NUMBER_FIRST_CHARS: str = "+-.0123456789"
+
+# Signature of the functions created from APDL macros, split in three lines.
+MACRO_ARGUMENTS: Tuple[str, ...] = tuple(
+    ", ".join(f"ARG{i}=''" for i in range(start, start + 6)) for start in (1, 7, 13)
+)
+
+# Macro arguments used inside a function body, from ARG1 to ARG18.
+MACRO_ARGUMENT_REGEX = re.compile(r"ARG(?:1[0-8]|[1-9])")
+
+
+@cache
+def _get_mapdl_methods() -> FrozenSet[str]:
+    """Names of the attributes of the ``Mapdl`` class."""
+    # Imported here to avoid circular imports
+    from ansys.mapdl.core import Mapdl
+
+    return frozenset(dir(Mapdl))
+
+
+@cache
+def _get_pymapdl_commands() -> Tuple[str, ...]:
+    """Sorted names of the PyMAPDL commands."""
+    return tuple(sorted(dir(Commands)))
+
 
 def convert_script(
     filename_in: str,
@@ -253,9 +291,6 @@ def convert_script(
     >>> mapdl.input_strings(cmds.splitlines()[2:10])
 
     """
-    with open(filename_in, "r") as fid:
-        apdl_strings = fid.readlines()
-
     if filename_out is None:
         filename_out = os.path.splitext(filename_in)[0] + ".py"
         if os.path.exists(filename_out):
@@ -263,25 +298,27 @@ def convert_script(
                 f"The predefined output file '{filename_out}' already exists."
             )
 
-    translator = _convert(
-        apdl_strings=apdl_strings,
-        loglevel=loglevel,
-        auto_exit=auto_exit,
-        line_ending=line_ending,
-        exec_file=exec_file,
-        macros_as_functions=macros_as_functions,
-        use_function_names=use_function_names,
-        show_log=show_log,
-        add_imports=add_imports,
-        comment_solve=comment_solve,
-        cleanup_output=cleanup_output,
-        header=header,
-        print_com=print_com,
-        only_commands=only_commands,
-        use_vtk=use_vtk,
-        clear_at_start=clear_at_start,
-        check_parameter_names=check_parameter_names,
-    )
+    # The file is translated line by line while it is read.
+    with open(filename_in, "r") as fid:
+        translator = _convert(
+            apdl_strings=fid,
+            loglevel=loglevel,
+            auto_exit=auto_exit,
+            line_ending=line_ending,
+            exec_file=exec_file,
+            macros_as_functions=macros_as_functions,
+            use_function_names=use_function_names,
+            show_log=show_log,
+            add_imports=add_imports,
+            comment_solve=comment_solve,
+            cleanup_output=cleanup_output,
+            header=header,
+            print_com=print_com,
+            only_commands=only_commands,
+            use_vtk=use_vtk,
+            clear_at_start=clear_at_start,
+            check_parameter_names=check_parameter_names,
+        )
 
     translator.save(filename_out)
     return translator.lines
@@ -519,9 +556,9 @@ class FileTranslator:
         }
 
         self._non_interactive_commands = (
-            list(_NON_INTERACTIVE_COMMANDS)
-            + list(self._block_commands)
-            + list(self._enum_block_commands)
+            frozenset(_NON_INTERACTIVE_COMMANDS)
+            | frozenset(self._block_commands)
+            | frozenset(self._enum_block_commands)
         )
 
         self._chained_commands = 0
@@ -666,10 +703,8 @@ class FileTranslator:
                 self.store_comment()
                 return
             else:  # command and in-line comment
-                split_line = line.split("!")
-                line = split_line[0]
-                self.comment = " ".join(split_line[1:])
-                self.comment = self.comment.lstrip()
+                line, _, comment = line.partition("!")
+                self.comment = comment.replace("!", " ").lstrip()
 
         if not line:
             # Keeping empty lines
@@ -692,7 +727,8 @@ class FileTranslator:
         line = line[:-1] if line[-1] == "," else line
         line_upper = line.upper()
 
-        cmd_caps = line.split(",")[0].upper()
+        fields = line.split(",")
+        cmd_caps = fields[0].upper()
         cmd_caps_short = cmd_caps[:4]
 
         items = self._get_items(line.strip())
@@ -779,11 +815,11 @@ class FileTranslator:
             return
 
         if cmd_caps_short == "/TIT":  # /TITLE
-            parameters = line.split(",")[1:]
+            parameters = fields[1:]
             return self.store_command("title", [",".join(parameters).strip()])
 
         if cmd_caps_short == "/AXL":  # /AXLAB
-            parameters = line.split(",")[1:]
+            parameters = fields[1:]
             parameters_ = [parameters[0], ",".join(parameters[1:])]
             return self.store_command("axlab", parameters_)
 
@@ -792,7 +828,7 @@ class FileTranslator:
                 self.store_run_command(line)
                 return
             else:
-                parameters = line.split(",")[1:]
+                parameters = fields[1:]
                 return self.store_command("get", parameters)
 
         if cmd_caps_short == "/NOP":
@@ -893,7 +929,7 @@ class FileTranslator:
                 self._block_count = 0
                 if cmd_caps_short == "CMBL":  # In cmblock
                     # CMBLOCK,Cname,Entity,NUMITEMS,,,,,KOPT
-                    numitems = int(line.split(",")[3])
+                    numitems = int(fields[3])
                     _block_count_target = (
                         numitems // 8 + 1 if numitems % 8 != 0 else numitems // 8
                     )
@@ -927,9 +963,7 @@ class FileTranslator:
                         command = command[1:]
 
                 # Some commands are abbreviated (only 4 letters)
-                from ansys.mapdl.core import Mapdl
-
-                if command not in dir(Mapdl):
+                if command not in _get_mapdl_methods():
                     command = self.find_match(command)
 
             # Storing
@@ -952,19 +986,11 @@ class FileTranslator:
         self.store_empty_line()
         self._infunction = True
         spacing = " " * (len(func_name) + 5)
-        line = self.indent + "def %s(%s," % (
-            func_name,
-            ", ".join(["ARG%d=''" % i for i in range(1, 7)]),
-        )
-        line += "\n"
-        line += "%s%s," % (
-            spacing,
-            ", ".join(["ARG%d=''" % i for i in range(7, 13)]),
-        )
-        line += "\n"
-        line += "%s%s):" % (
-            spacing,
-            ", ".join(["ARG%d=''" % i for i in range(13, 19)]),
+        first, second, third = MACRO_ARGUMENTS
+        line = (
+            f"{self.indent}def {func_name}({first},\n"
+            f"{spacing}{second},\n"
+            f"{spacing}{third}):"
         )
         self.lines.append(line)
         self.indent = self.indent + "    "
@@ -985,37 +1011,13 @@ class FileTranslator:
         command = command.strip()
 
         if self._infunction and "ARG" in command:
-            args = []
-            for i in range(1, 19):
-                arg = "ARG%d" % i
-                c = 0
-                if arg in command:
-                    command = command.replace(arg, "{" + f"{arg}" + "}")
-                    args.append(arg)
-                    c += 1
-
-            line = '%s%s.%srun(f"%s")' % (
-                self.indent,
-                self.obj_name,
-                underscore,
-                command,
-            )
-
-        elif self.comment:
-            line = '%s%s.%srun("%s")  # %s' % (
-                self.indent,
-                self.obj_name,
-                underscore,
-                command,
-                self.comment,
-            )
+            command = MACRO_ARGUMENT_REGEX.sub(r"{\g<0>}", command)
+            line = f'{self.indent}{self.obj_name}.{underscore}run(f"{command}")'
         else:
-            line = '%s%s.%srun("%s")' % (
-                self.indent,
-                self.obj_name,
-                underscore,
-                command,
-            )
+            line = f'{self.indent}{self.obj_name}.{underscore}run("{command}")'
+            if self.comment:
+                line = f"{line}  # {self.comment}"
+
         self.lines.append(line)
 
     def store_comment(self) -> None:
@@ -1035,7 +1037,7 @@ class FileTranslator:
         parsed_parameters = []
         for parameter in parameters:
             parameter = parameter.strip()
-            if is_float(parameter) and parameter.upper() != "INF":
+            if parameter[:1] in NUMBER_FIRST_CHARS and is_float(parameter):
                 parsed_parameters.append(parameter)
             elif "ARG" in parameter and self._infunction:
                 parsed_parameters.append("%s" % parameter)
@@ -1053,21 +1055,9 @@ class FileTranslator:
         """Stores a valid pyansys function with parameters"""
         parameter_str = self._parse_arguments(parameters)
 
+        line = f"{self.indent}{self.obj_name}.{function}({parameter_str})"
         if self.comment:
-            line = "%s%s.%s(%s)  # %s" % (
-                self.indent,
-                self.obj_name,
-                function,
-                parameter_str,
-                self.comment,
-            )
-        else:
-            line = "%s%s.%s(%s)" % (
-                self.indent,
-                self.obj_name,
-                function,
-                parameter_str,
-            )
+            line = f"{line}  # {self.comment}"
 
         self.lines.append(line)
 
@@ -1103,7 +1093,8 @@ class FileTranslator:
 
     def output_to_file(self, line: str) -> bool:
         """Return if an APDL line is redirecting to a file."""
-        if line[:4].upper() == "/OUT":
+        cmd_caps_short = line[:4].upper()
+        if cmd_caps_short == "/OUT":
             # We are redirecting the output to somewhere, probably a file.
             # Because of the problem with the ansys output, we need to execute
             # this in non_interactive mode.
@@ -1115,7 +1106,7 @@ class FileTranslator:
                     return True
 
         if (
-            line[:4].upper() == "*CFO"
+            cmd_caps_short == "*CFO"
         ):  # any([each[0:4] in '*CFOPEN' for each in dir(Commands)])
             # We might not need going into interactive mode for *CFOPEN/*CFCLOSE
             return True
@@ -1123,7 +1114,8 @@ class FileTranslator:
         return False
 
     def output_to_default(self, line: str) -> bool:
-        if line[:4].upper() == "/OUT":
+        cmd_caps_short = line[:4].upper()
+        if cmd_caps_short == "/OUT":
             # We are redirecting the output to somewhere, probably a file.
             # Because of the problem with the ansys output, we need to execute
             # this in non_interactive mode.
@@ -1135,7 +1127,7 @@ class FileTranslator:
                 if opt1 == "TERM":
                     # A file is supplied.
                     return True
-        if line[:4].upper() in "*CFCLOSE":
+        if cmd_caps_short in "*CFCLOSE":
             # We might not need going into interactive mode for *CFOPEN/*CFCLOSE
             return True
 
@@ -1165,31 +1157,29 @@ class FileTranslator:
 
         return items
 
-    def _get_valid_pymapdl_methods_short(self) -> List[str]:
-        pymethods = dir(Commands)
-
-        reduced_list = []
-        for each_method in pymethods:
+    @staticmethod
+    @cache
+    def _get_valid_pymapdl_methods_short() -> FrozenSet[str]:
+        reduced_set = set()
+        for each_method in _get_pymapdl_commands():
             if not re.match(r"^[\*~/A-Za-z]\w*$", each_method):
                 continue
             if each_method.startswith("slash"):
-                reduced_list.append(each_method[:8])
+                reduced_set.add(each_method[:8])
             elif each_method.startswith("star"):
-                reduced_list.append(each_method[:7])
+                reduced_set.add(each_method[:7])
             else:
-                reduced_list.append(each_method[:4])
-        return reduced_list
+                reduced_set.add(each_method[:4])
+        return frozenset(reduced_set)
 
     def find_match(self, cmd: str) -> str:
-        pymethods = sorted(dir(Commands))
-
-        for each in pymethods:
+        for each in _get_pymapdl_commands():
             if each.startswith(cmd):
                 return each
 
 
 def _convert(
-    apdl_strings: str,
+    apdl_strings: Union[str, Iterable[str]],
     loglevel: str = "WARNING",
     auto_exit: bool = True,
     line_ending: Optional[str] = None,
@@ -1207,6 +1197,12 @@ def _convert(
     clear_at_start: bool = False,
     check_parameter_names: bool = False,
 ) -> FileTranslator:
+    """Translate APDL code using a :class:`FileTranslator`.
+
+    ``apdl_strings`` is either a string with the whole APDL code, which
+    is split using its line ending, or an iterable of lines, such as an
+    open file object.  Lines are translated as they are read.
+    """
     if only_commands:
         auto_exit = False
         add_imports = False
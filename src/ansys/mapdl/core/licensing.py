@@ -22,6 +22,8 @@
 
 """Module for licensing and license serve checks."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 import os
 import socket
 
@@ -75,7 +77,8 @@ class LicenseChecker:
     Parameters
     ----------
     timeout : float, optional
-        Timeout for the licensing log file check.
+        Timeout for the licensing log file check and the license
+        checkout.
 
     """
 
@@ -245,10 +248,11 @@ class LicenseChecker:
         self, file_iterator, licdebug_file, timeout=30, notify_at_second=5
     ):
         """Loop over iterator"""
-        max_time = time.time() + timeout
-        notification_time = time.time() + notify_at_second
+        start_time = time.monotonic()
+        max_time = start_time + timeout
+        notification_time = start_time + notify_at_second
         notification_bool = True
-        while time.time() < max_time:
+        while time.monotonic() < max_time:
             if self.stop:  # pragma: no cover
                 LOG.debug("The license checker has received a stop signal.")
                 raise Exception("The license checker has been stopped.")
@@ -258,7 +262,7 @@ class LicenseChecker:
                 return True
 
             if (
-                time.time() > notification_time and notification_bool
+                time.monotonic() > notification_time and notification_bool
             ):  # pragma: no cover
                 msg = (
                     "PyMAPDL is taking longer than expected to connect to an MAPDL session.\n"
@@ -269,8 +273,13 @@ class LicenseChecker:
                 notification_bool = False
 
             msg = next(file_iterator)
-            if msg:
-                LOG.debug(f"Output from {licdebug_file}:\n{msg}")
+            if not msg:
+                # Nothing new in the file yet. Waiting instead of spinning
+                # on the file until the timeout.
+                time.sleep(0.01)
+                continue
+
+            LOG.debug(f"Output from {licdebug_file}:\n{msg}")
 
             if "DENIED" in msg:
                 # read to the end of the file
@@ -292,7 +301,7 @@ class LicenseChecker:
             f"Exceeded timeout of {timeout} seconds while examining:\n{licdebug_file}"
         )
 
-    def _checkout_license(self, lic, host=None, port=2325):
+    def _checkout_license(self, lic, host=None, port=2325, timeout=None):
         """Check if a license is available using the Ansys license utility.
 
         It uses it own process.
@@ -311,6 +320,14 @@ class LicenseChecker:
             overrides any settings from the default license path.
         port : int, optional
             Port on the host to connect to.  Only used when ``host`` is set.
+        timeout : float, optional
+            Maximum time to wait for ``ansysli_util`` to finish.  By
+            default, it waits until the process ends.
+
+        Raises
+        ------
+        TimeoutError
+            Exceeded ``timeout`` while waiting for ``ansysli_util``.
 
         """
         if lic.lower() not in ALLOWABLE_LICENSES:  # pragma: no cover
@@ -324,22 +341,39 @@ class LicenseChecker:
                 f"{ansysli_util_path}"
             )
 
-        # allow the specification of ip and port
-        env = os.environ.copy()
+        # allow the specification of ip and port. Otherwise, the process
+        # inherits the current environment.
+        env = None
         if host is not None and port is not None:  # pragma: no cover
-            env["ANSYSLI_SERVERS"] = f"{host}:{port}"
-            env["ANS_FLEXLM_DISABLE_DEFLICPATH"] = "TRUE"
+            env = {
+                **os.environ,
+                "ANSYSLI_SERVERS": f"{host}:{port}",
+                "ANS_FLEXLM_DISABLE_DEFLICPATH": "TRUE",
+            }
 
         tstart = time.time()
         # ansysli_util_path is controlled by the library.
         # Excluding bandit check.
+        # The arguments are passed as a list without shell, so the path
+        # must not be quoted. No console window is opened on Windows.
         process = subprocess.Popen(
-            [f'"{ansysli_util_path}"', "-checkout", f"{lic}"],
+            [ansysli_util_path, "-checkout", lic],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             env=env,
+            shell=False,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
         )  # nosec B603
-        output = process.stdout.read().decode()
+        try:
+            output, _ = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise TimeoutError(
+                f"Exceeded timeout of {timeout} seconds while checking out "
+                f"the license '{lic}' with:\n{ansysli_util_path}"
+            )
+        output = output.decode()
 
         t_elap = time.time() - tstart
         LOG.debug(f"License check complete in {t_elap:.2} seconds.\n")
@@ -392,10 +426,18 @@ class LicenseChecker:
 
         msg1 = "No such feature exists"
         msg2 = "The server is down or is not responsive."
-        for each_license in licenses:
-            output = self._checkout_license(each_license, host)
-            if msg1 in output or msg2 in output:
-                raise LicenseServerConnectionError(output)
+        # Each checkout runs its own ``ansysli_util`` process, so all the
+        # licenses are checked at the same time.
+        with ThreadPoolExecutor(max_workers=max(len(licenses), 1)) as executor:
+            outputs = executor.map(
+                lambda each_license: self._checkout_license(
+                    each_license, host, timeout=self._timeout
+                ),
+                licenses,
+            )
+            for output in outputs:
+                if msg1 in output or msg2 in output:
+                    raise LicenseServerConnectionError(output)
 
         return True
 
@@ -434,8 +476,8 @@ def get_ansys_license_debug_file_tail(licdebug_file, start_timeout=10, debug=Fal
         if not debug:  # pragma: no cover
             fid.seek(0, 2)
         while True:
-            lines = "".join(fid.readlines())
-            yield lines
+            # Everything written since the last call, in a single read.
+            yield fid.read()
 
 
 def get_ansys_license_directory():  # pragma: no cover
@@ -472,6 +514,16 @@ def get_ansys_license_directory():  # pragma: no cover
     return ansyslic_dir
 
 
+@cache
+def _get_default_mapdl_version():  # pragma: no cover
+    """Version of the default MAPDL installation.
+
+    Finding the installation walks the file system, so the result is
+    cached for the session.
+    """
+    return version_from_path("mapdl", get_mapdl_path(allow_input=False))
+
+
 def get_ansys_license_debug_file_name():  # pragma: no cover
     """Get license client log file name.
 
@@ -494,19 +546,13 @@ def get_ansys_license_debug_file_name():  # pragma: no cover
     # - For version 22.1 and above: `licdebug.$hostname.$appname.$version.out`
     # - For version 21.2 and below: `licdebug.$appname.$version.out`
 
-    name = "licdebug"
-    hostname = socket.gethostname()
-    appname = APP_NAME
     # This is the type of license my client requests (Windows 10, 2021R2)
-    version = version_from_path("mapdl", get_mapdl_path(allow_input=False))
-    ending = "out"
+    version = _get_default_mapdl_version()
 
     if version < 221:
-        parts = (name, appname, version, ending)
+        return f"licdebug.{APP_NAME}.{version}.out"
     else:
-        parts = (name, hostname, appname, version, ending)
-
-    return ".".join([str(each_part) for each_part in parts])
+        return f"licdebug.{socket.gethostname()}.{APP_NAME}.{version}.out"
 
 
 def get_ansys_license_debug_file_path():  # pragma: no cover
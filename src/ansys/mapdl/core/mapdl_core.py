@@ -176,7 +176,9 @@ INVAL_COMMANDS_SILENT = {
     "/NOPR": "Suppressing console output is not recommended, use ``Mute`` parameter instead. This command is disabled in interactive mode."
 }
 
-PLOT_COMMANDS = ["NPLO", "EPLO", "KPLO", "LPLO", "APLO", "VPLO", "PLNS", "PLES"]
+PLOT_COMMANDS = frozenset(
+    ["NPLO", "EPLO", "KPLO", "LPLO", "APLO", "VPLO", "PLNS", "PLES"]
+)
 MAX_COMMAND_LENGTH = 600  # actual is 640, but seems to fail above 620
 
 VALID_SELECTION_TYPE_TP = Literal["S", "R", "A", "U"]
@@ -224,8 +226,9 @@ def parse_to_short_cmd(command):
     'VPLO'
     """
     try:
-        short_cmd = command.split(",")[0]
-        return short_cmd[:4].upper()
+        # The first four characters of the first field. Slicing before
+        # partitioning avoids splitting the whole command.
+        return command[:4].partition(",")[0].upper()
     except Exception:  # pragma: no cover
         return
 
@@ -1396,16 +1399,17 @@ class _MapdlCore(Commands):
         chunk = []
         for command in self._stored_commands:
             len_command = len(command) + 1  # include sep var
-            if len_command + c > MAX_COMMAND_LENGTH:
+            if chunk and len_command + c > MAX_COMMAND_LENGTH:
                 chained_commands.append("$".join(chunk))
                 chunk = [command]
-                c = 0
+                c = len_command
             else:
                 chunk.append(command)
                 c += len_command
 
         # join the last
-        chained_commands.append("$".join(chunk))
+        if chunk:
+            chained_commands.append("$".join(chunk))
         self._stored_commands = []
 
         responses = [self._run(command) for command in chained_commands]
@@ -1739,8 +1743,6 @@ class _MapdlCore(Commands):
             f.write("RESUME\n")
 
         # issue system command to run ansys in GUI mode
-        cwd = os.getcwd()
-        os.chdir(run_dir)
         exec_file = self._start_parm.get("exec_file", get_mapdl_path(allow_input=False))
         nproc = self._start_parm.get("nproc", 2)
         add_sw = self._start_parm.get("additional_switches", "")
@@ -1775,9 +1777,6 @@ class _MapdlCore(Commands):
             cwd=run_dir,
         )  # nosec B603
 
-        # Going back
-        os.chdir(cwd)
-
         # Clearing
         os.remove(start_file)
         os.remove(other_start_file)
@@ -2277,7 +2276,7 @@ class _MapdlCore(Commands):
             self._file_type_for_plots = command.split(",")[1].upper()
 
         # Invalid commands silently ignored.
-        cmd_ = command.split(",")[0].upper()
+        cmd_ = command.partition(",")[0].upper()
         if cmd_ in INVAL_COMMANDS_SILENT:
             msg = f"{cmd_} is ignored: {INVAL_COMMANDS_SILENT[cmd_]}."
             self._log.info(msg)
@@ -2288,23 +2287,24 @@ class _MapdlCore(Commands):
                 f"/com, PyMAPDL: {msg}"  # Using '!' makes the output of '_run' empty
             )
 
-        if command[:3].upper() in INVAL_COMMANDS:
+        cmd_caps_short = command[:4].upper()
+        if cmd_caps_short[:3] in INVAL_COMMANDS:
             exception = MapdlRuntimeError(
                 'Invalid PyMAPDL command "%s"\n\n%s'
-                % (command, INVAL_COMMANDS[command[:3].upper()])
+                % (command, INVAL_COMMANDS[cmd_caps_short[:3]])
             )
             raise exception
-        elif command[:4].upper() in INVAL_COMMANDS:
+        elif cmd_caps_short in INVAL_COMMANDS:
             exception = MapdlRuntimeError(
                 'Invalid PyMAPDL command "%s"\n\n%s'
-                % (command, INVAL_COMMANDS[command[:4].upper()])
+                % (command, INVAL_COMMANDS[cmd_caps_short])
             )
             raise exception
         elif write_to_log and self._apdl_log is not None:
             if not self._apdl_log.closed:
                 self._apdl_log.write("%s\n" % command)
 
-        if command[:4].upper() == "/LIS":
+        if cmd_caps_short == "/LIS":
             # simply return the contents of the file
             return self.list(*command.split(",")[1:])
 
@@ -2323,8 +2323,9 @@ class _MapdlCore(Commands):
         text = self._run(command, verbose=verbose, mute=mute)
 
         if (
-            "Display device has not yet been specified with the /SHOW command" in text
-            and short_cmd in PLOT_COMMANDS
+            short_cmd in PLOT_COMMANDS
+            and "Display device has not yet been specified with the /SHOW command"
+            in text
         ):
             # Reissuing the command to make sure we get output.
             self.show(self.default_file_type_for_plots)
@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 from functools import wraps
+import io
 import os
 import pathlib
 import tempfile
@@ -32,6 +33,7 @@ from numpy.typing import DTypeLike, NDArray
 
 from ansys.mapdl.core import LOG as logger
 from ansys.mapdl.core import _HAS_VISUALIZER
+from ansys.mapdl.core._commands import parse
 from ansys.mapdl.core.commands import CommandListingOutput
 from ansys.mapdl.core.errors import (
     CommandDeprecated,
@@ -45,9 +47,12 @@ from ansys.mapdl.core.mapdl_types import KwargDict, MapdlFloat
 from ansys.mapdl.core.misc import (
     allow_iterables_vmin,
     allow_pickable_entities,
+    compress_ranges,
     load_file,
     random_string,
     supress_logging,
+    write_elements,
+    write_nodes,
 )
 
 
@@ -291,6 +296,40 @@ class _MapdlCommandExtended(_MapdlCore):
 
         return wrapped(self, *args, **kwargs)
 
+    @wraps(_MapdlCore.edele)
+    def edele(self, iel1="", iel2="", inc="", **kwargs) -> str:
+        """Wraps superclassed EDELE to allow to use a list/tuple/array for iel1.
+
+        The element numbers are compressed in as few ``EDELE,iel1,iel2,inc``
+        commands as possible, which are sent together in a single block
+        using the :attr:`non_interactive
+        <ansys.mapdl.core.Mapdl.non_interactive>` context manager.
+        Keyword arguments such as ``mute`` are passed to :meth:`run()
+        <ansys.mapdl.core.Mapdl.run>` for each command.  The output is
+        returned as a string, which is empty if the output is muted, in
+        which case the printout of the whole block is suppressed using
+        ``/NOPR``.
+        An empty iterable sends nothing and returns an empty string.
+        It will raise an error in case iel2 or inc are used too.
+        """
+        if not isinstance(iel1, (set, tuple, list, np.ndarray)):
+            return super().edele(iel1, iel2, inc, **kwargs)
+
+        if iel2 or inc:
+            raise ValueError(
+                "If an iterable is used as 'iel1' argument, "
+                "it is not allowed to use 'iel2' or 'inc' arguments."
+            )
+
+        if not len(iel1):
+            return ""
+
+        commands = [
+            f"EDELE,{iel1_},{iel2_},{inc_}"
+            for iel1_, iel2_, inc_ in compress_ranges(list(iel1))
+        ]
+        return self._input_commands(commands, **kwargs)
+
     @wraps(_MapdlCore.dim)
     def dim(
         self,
@@ -1257,8 +1296,8 @@ class _MapdlCommandExtended(_MapdlCore):
                 pl.plot([], [], [], mapdl=self, **kwargs)
                 return pl.show(**kwargs)
 
-            # TODO: Consider caching the surface
-            esurf = self.mesh._grid.linear_copy().extract_surface().clean()
+            # The surface is cached in the mesh and reset with it
+            esurf = self.mesh._surf
             kwargs.setdefault("show_edges", True)
 
             # if show_node_numbering:
@@ -1272,7 +1311,12 @@ class _MapdlCommandExtended(_MapdlCore):
                 ]
 
             pl.plot(
-                [{"mesh": esurf, "style": kwargs.pop("style", "surface")}],
+                [
+                    {
+                        "mesh": esurf.copy(deep=False),
+                        "style": kwargs.pop("style", "surface"),
+                    }
+                ],
                 [],
                 labels,
                 mapdl=self,
@@ -2350,6 +2394,553 @@ class _MapdlExtended(_MapdlCommandExtended):
         else:
             self.slashdelete(filename)
 
+    def load_nodes(self, nodes, nnum=None):
+        """Load nodes from Python into MAPDL.
+
+        The nodes are written to a file in the ``NWRITE`` format, which
+        is then read in MAPDL with a single :meth:`nread
+        <ansys.mapdl.core.Mapdl.nread>` command.  This is much faster
+        than creating the nodes one by one.
+
+        Parameters
+        ----------
+        nodes : np.ndarray or list
+            Node coordinates with shape ``(n_node, 3)``.
+
+        nnum : np.ndarray or list, optional
+            Node numbers.  Defaults to ``1, 2, ..., n_node``.  Nodes
+            already in the database are overwritten.
+
+        Examples
+        --------
+        >>> mapdl.prep7()
+        >>> mapdl.load_nodes([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+        >>> mapdl.mesh.n_node
+        4
+
+        """
+        base_name = random_string() + ".node"
+        filename = os.path.join(tempfile.gettempdir(), base_name)
+        self._log.info(f"Generating file for nodes in {filename}")
+        write_nodes(filename, nodes, nnum)
+        return self._read_generated_file(self.nread, filename, base_name)
+
+    def load_elements(self, elements, mat=1, type_=1, real=1, secnum=1, esys=0):
+        """Load elements from Python into MAPDL.
+
+        The elements are written to a file in the ``EWRITE`` format,
+        which is then read in MAPDL with a single :meth:`eread
+        <ansys.mapdl.core.Mapdl.eread>` command.  This is much faster
+        than creating the elements one by one.
+
+        The nodes and the element types must be defined before calling
+        this method.  Elements are numbered consecutively, starting from
+        the current highest element number plus one.
+
+        Parameters
+        ----------
+        elements : np.ndarray or list
+            Node numbers with shape ``(n_elem, n_nodes)``, where
+            ``n_nodes`` is up to 8.  Unused node positions must be zero.
+
+        mat, type_, real, secnum, esys : int or np.ndarray, optional
+            Element attributes.  Either a single value for all the
+            elements or one value per element.
+
+        Examples
+        --------
+        >>> mapdl.prep7()
+        >>> mapdl.et(1, "SHELL181")
+        >>> mapdl.load_nodes([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+        >>> mapdl.load_elements([[1, 2, 3, 4]])
+        >>> mapdl.mesh.n_elem
+        1
+
+        """
+        base_name = random_string() + ".elem"
+        filename = os.path.join(tempfile.gettempdir(), base_name)
+        self._log.info(f"Generating file for elements in {filename}")
+        write_elements(filename, elements, mat, type_, real, secnum, esys)
+        return self._read_generated_file(self.eread, filename, base_name)
+
+    def _read_generated_file(self, read_function, filename, base_name):
+        """Read a file generated in Python with a MAPDL command and delete it."""
+        try:
+            if self._local:
+                return read_function(filename)
+
+            self.upload(filename, progress_bar=False)
+            try:
+                return read_function(base_name)
+            finally:
+                self.slashdelete(base_name)
+        finally:
+            os.remove(filename)
+
+    def e_batch(self, elements, enum=None):
+        """Define several elements by node connectivity in a single call.
+
+        Each row of ``elements`` is sent to MAPDL as an :meth:`e
+        <ansys.mapdl.core.Mapdl.e>` command, or as an :meth:`en
+        <ansys.mapdl.core.Mapdl.en>` command if ``enum`` is given.
+        All the commands are sent
+        together using :meth:`input_strings()
+        <ansys.mapdl.core.Mapdl.input_strings>`, hence avoiding one
+        round-trip to MAPDL per element.
+
+        The current (or default) ``MAT``, ``TYPE``, ``REAL``, ``SECNUM``
+        and ``ESYS`` attribute values are assigned to the elements.
+
+        Parameters
+        ----------
+        elements : np.ndarray or list
+            Array of node numbers with shape ``(n_elem, n_nodes)``, where
+            ``n_nodes`` is between 1 and 8.  It is converted to a
+            contiguous ``np.int32`` array.
+
+        enum : np.ndarray or list, optional
+            Element numbers.  Defaults to the lowest available element
+            numbers.
+
+        Returns
+        -------
+        list[int]
+            Numbers of the created elements.  Empty if ``elements`` is
+            empty, in which case nothing is sent to MAPDL.  ``None`` if
+            called within the :attr:`non_interactive
+            <ansys.mapdl.core.Mapdl.non_interactive>` context manager.
+
+        Examples
+        --------
+        Create two SURF154 elements.
+
+        >>> mapdl.prep7()
+        >>> mapdl.et(1, 'SURF154')
+        >>> mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]])
+        [1, 2, 3, 4, 5, 6]
+        >>> mapdl.e_batch([[1, 2, 3, 4], [2, 5, 6, 3]])
+        [1, 2]
+
+        Define the same elements with numbers 10 and 20.
+
+        >>> mapdl.e_batch([[1, 2, 3, 4], [2, 5, 6, 3]], enum=[10, 20])
+        [10, 20]
+
+        """
+        elements = np.ascontiguousarray(elements, dtype=np.int32)
+        if not elements.size:
+            return []
+
+        if elements.ndim == 1:
+            elements = elements.reshape(1, -1)
+
+        if elements.ndim != 2 or not 0 < elements.shape[1] <= 8:
+            raise ValueError(
+                "Argument 'elements' must be an array of shape (n_elem, n_nodes) "
+                "with up to 8 nodes per element."
+            )
+
+        command = "E"
+        if enum is not None:
+            enum = np.asarray(enum, dtype=np.int32).ravel()
+            if enum.size != elements.shape[0]:
+                raise ValueError(
+                    "Arguments 'elements' and 'enum' must have the same number of rows."
+                )
+            elements = np.column_stack((enum, elements))
+            command = "EN"
+
+        # Format all the commands at once rather than row by row.
+        commands = io.StringIO()
+        np.savetxt(commands, elements, fmt=command + ",%d" * elements.shape[1])
+        return parse.parse_e_many(self.input_strings(commands.getvalue()))
+
+    def eintf_batch(self, toler=0.0001, tlab="LOW"):
+        """Define two-node elements between coincident selected nodes.
+
+        Client side equivalent of :meth:`eintf
+        <ansys.mapdl.core.Mapdl.eintf>` for coincident nodes.  The
+        coincident node pairs are found using a KD-tree from ``scipy``,
+        and the elements are created using :meth:`e_batch
+        <ansys.mapdl.core.Mapdl.e_batch>`.
+
+        Only the node locations are checked for coincidence.  The node
+        orientations are not considered.
+
+        Parameters
+        ----------
+        toler : float, optional
+            Tolerance for coincidence, based on the maximum Cartesian
+            coordinate difference between node locations.  Defaults to
+            0.0001.
+
+        tlab : str, optional
+            Nodal number ordering. Allowable values are:
+
+            * ``"LOW"`` - The elements are generated from the lowest
+              numbered node to the highest numbered node.
+
+            * ``"HIGH"`` - The elements are generated from the highest
+              numbered node to the lowest numbered node.
+
+        Returns
+        -------
+        list[int]
+            Numbers of the created elements.
+
+        Notes
+        -----
+        As with ``EINTF``, for more than two coincident nodes in a
+        cluster, an element is generated from the lowest numbered node
+        to each of the other nodes in the cluster.  Clusters are built by
+        chaining coincident node pairs, so a cluster can contain nodes
+        farther than ``toler`` apart.
+
+        The element type must be set to a 2-node element before calling
+        this method.
+
+        Examples
+        --------
+        >>> mapdl.et(1, "COMBIN14")
+        >>> mapdl.n_batch([[0, 0, 0], [1, 0, 0], [0, 0, 0], [1, 0, 0]])
+        [1, 2, 3, 4]
+        >>> mapdl.eintf_batch()
+        [1, 2]
+
+        """
+        try:
+            from scipy.sparse import csr_matrix
+            from scipy.sparse.csgraph import connected_components
+            from scipy.spatial import cKDTree
+        except ImportError:  # pragma: no cover
+            raise ImportError("Install ``scipy`` to use this feature") from None
+
+        if tlab.upper() not in ["LOW", "HIGH"]:
+            raise ValueError("Argument 'tlab' must be either 'LOW' or 'HIGH'.")
+
+        nnum = self.mesh.nnum
+        pairs = cKDTree(self.mesh.nodes).query_pairs(
+            toler, p=np.inf, output_type="ndarray"
+        )
+        if not pairs.size:
+            return []
+
+        # Clusters of coincident nodes, including chained pairs
+        graph = csr_matrix(
+            (np.ones(pairs.shape[0]), (pairs[:, 0], pairs[:, 1])),
+            shape=(nnum.size, nnum.size),
+        )
+        _, labels = connected_components(graph, directed=False)
+
+        # Connect the lowest numbered node of each cluster to the others
+        clustered = np.unique(pairs)
+        labels, nums = labels[clustered], nnum[clustered]
+        order = np.lexsort((nums, labels))
+        labels, nums = labels[order], nums[order]
+        first = np.ones(labels.size, dtype=bool)
+        first[1:] = labels[1:] != labels[:-1]
+        lowest = nums[first][np.cumsum(first) - 1]
+        pairs = np.column_stack((lowest[~first], nums[~first]))
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        if tlab.upper() == "HIGH":
+            pairs = pairs[:, ::-1]
+
+        return self.e_batch(pairs)
+
+    def enorm_batch(self):
+        """Reorient the shell element normals of every selected panel.
+
+        :meth:`enorm <ansys.mapdl.core.Mapdl.enorm>` only reorients the
+        elements connected to the given element.  This method finds the
+        panels (groups of selected elements connected through their
+        edges) using ``scipy``, and reorients each panel to match its
+        lowest numbered element.  All the ``ENORM`` commands are sent
+        together using :meth:`input_strings()
+        <ansys.mapdl.core.Mapdl.input_strings>`.
+
+        Returns
+        -------
+        str
+            Command output from MAPDL.  Empty if no elements are
+            selected.
+
+        Notes
+        -----
+        Only shell elements should be selected.  The panels are found
+        using the first four nodes (corner nodes) of each element.
+
+        Examples
+        --------
+        >>> mapdl.esel("S", "TYPE", "", 1)
+        >>> mapdl.enorm_batch()
+
+        """
+        try:
+            from scipy.sparse import csr_matrix
+            from scipy.sparse.csgraph import connected_components
+        except ImportError:  # pragma: no cover
+            raise ImportError("Install ``scipy`` to use this feature") from None
+
+        elem = self.mesh.elem
+        if not elem:
+            return ""
+
+        enum = np.array([each[8] for each in elem], dtype=np.int32)
+        corners = np.array(
+            [np.pad(each[10:14], (0, 4 - each[10:14].size), "edge") for each in elem]
+        )
+
+        # Edges of each element, with sorted node numbers
+        edges = np.sort(np.stack((corners, np.roll(corners, -1, axis=1)), axis=2))
+        edges = edges.reshape(-1, 2)
+        owner = np.repeat(np.arange(enum.size), 4)
+        valid = edges[:, 0] != edges[:, 1]
+        edges, owner = edges[valid], owner[valid]
+
+        # Elements sharing an edge are connected
+        order = np.lexsort((edges[:, 1], edges[:, 0]))
+        edges, owner = edges[order], owner[order]
+        shared = (edges[1:] == edges[:-1]).all(axis=1)
+        graph = csr_matrix(
+            (np.ones(shared.sum()), (owner[:-1][shared], owner[1:][shared])),
+            shape=(enum.size, enum.size),
+        )
+        _, labels = connected_components(graph, directed=False)
+
+        # Lowest element number of each panel
+        order = np.lexsort((enum, labels))
+        _, first = np.unique(labels[order], return_index=True)
+        seeds = enum[order[first]]
+
+        return self.input_strings([f"ENORM,{seed}" for seed in seeds])
+
+    def n_batch(self, nodes, nnum=None):
+        """Define several nodes in a single call.
+
+        Each row of ``nodes`` is sent to MAPDL as an :meth:`n
+        <ansys.mapdl.core.Mapdl.n>` command.  All the commands are sent
+        together using :meth:`input_strings()
+        <ansys.mapdl.core.Mapdl.input_strings>`, hence avoiding one
+        round-trip to MAPDL per node.
+
+        Parameters
+        ----------
+        nodes : np.ndarray or list
+            Array of node coordinates with shape ``(n_node, 3)``.  The
+            coordinates are interpreted in the active coordinate system.
+
+        nnum : np.ndarray or list, optional
+            Node numbers.  Defaults to the lowest available node numbers.
+
+        Returns
+        -------
+        list[int]
+            Numbers of the created nodes.  Empty if ``nodes`` is empty,
+            in which case nothing is sent to MAPDL.  ``None`` if called
+            within the :attr:`non_interactive
+            <ansys.mapdl.core.Mapdl.non_interactive>` context manager.
+
+        Examples
+        --------
+        >>> mapdl.prep7()
+        >>> mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0]], nnum=[10, 20, 30])
+        [10, 20, 30]
+
+        """
+        nodes = np.asarray(nodes, dtype=np.float64)
+        if not nodes.size:
+            return []
+
+        if nodes.ndim == 1:
+            nodes = nodes.reshape(1, -1)
+
+        if nodes.ndim != 2 or nodes.shape[1] != 3:
+            raise ValueError("Argument 'nodes' must be an array of shape (n_node, 3).")
+
+        if nnum is None:
+            nnum = [""] * nodes.shape[0]
+        else:
+            nnum = np.asarray(nnum, dtype=np.int64).ravel().tolist()
+            if len(nnum) != nodes.shape[0]:
+                raise ValueError(
+                    "Arguments 'nodes' and 'nnum' must have the same number of rows."
+                )
+
+        commands = [
+            f"N,{node},{x},{y},{z}" for node, (x, y, z) in zip(nnum, nodes.tolist())
+        ]
+        return parse.parse_n_many(self.input_strings(commands))
+
+    def emodif_batch(self, elements, stloc, values, **kwargs):
+        """Modify several previously defined elements in a single call.
+
+        Each entry of ``elements`` is sent to MAPDL as an :meth:`emodif
+        <ansys.mapdl.core.Mapdl.emodif>` command.  All the commands are
+        sent together in a single block using the :attr:`non_interactive
+        <ansys.mapdl.core.Mapdl.non_interactive>` context manager, hence
+        avoiding one round-trip to MAPDL per element.
+
+        Parameters
+        ----------
+        elements : np.ndarray or list
+            Numbers of the elements to modify.
+
+        stloc : str or int
+            Starting location (n) of the first node to be modified, or the
+            attribute label.  See :meth:`emodif <ansys.mapdl.core.Mapdl.emodif>`.
+
+        values : np.ndarray or list
+            Values to assign.  Either one value per element, or an array
+            with shape ``(n_elem, n_values)`` where ``n_values`` is up to 8.
+
+        **kwargs : dict, optional
+            Keyword arguments, such as ``mute``, passed to :meth:`run()
+            <ansys.mapdl.core.Mapdl.run>` for each command.  The commands
+            are still sent as a single block.  With ``mute=True`` the
+            printout of the whole block is suppressed using ``/NOPR``.
+
+        Returns
+        -------
+        str
+            Command output from MAPDL.  Empty if the output is muted, or
+            if ``elements`` is empty, in which case nothing is sent to
+            MAPDL.
+
+        Examples
+        --------
+        Assign material 2 to elements 1, 2 and 3.
+
+        >>> mapdl.emodif_batch([1, 2, 3], "MAT", [2, 2, 2])
+
+        """
+        elements = np.asarray(elements).ravel()
+        if not elements.size:
+            return ""
+
+        values = np.asarray(values)
+        if values.ndim < 2:
+            values = values.reshape(-1, 1)
+
+        if values.shape[0] != elements.shape[0] or values.shape[1] > 8:
+            raise ValueError(
+                "Argument 'values' must have one row per element with up to 8 values."
+            )
+
+        commands = [
+            f"EMODIF,{iel},{stloc}," + ",".join(str(each) for each in row)
+            for iel, row in zip(elements.tolist(), values.tolist())
+        ]
+        return self._input_commands(commands, **kwargs)
+
+    def ekill_batch(self, elements, **kwargs):
+        """Deactivate several elements in a single call.
+
+        The elements are selected using as few :meth:`esel
+        <ansys.mapdl.core.Mapdl.esel>` ranges as possible and deactivated
+        with a single :meth:`ekill <ansys.mapdl.core.Mapdl.ekill>`
+        command.  The element selection, saved in a temporary component
+        unless it is empty, is restored afterwards.  All these commands are sent together in
+        a single block using the :attr:`non_interactive
+        <ansys.mapdl.core.Mapdl.non_interactive>` context manager.
+
+        Parameters
+        ----------
+        elements : np.ndarray or list
+            Numbers of the elements to deactivate.
+
+        **kwargs : dict, optional
+            Keyword arguments, such as ``mute``, passed to :meth:`run()
+            <ansys.mapdl.core.Mapdl.run>` for each command.  The commands
+            are still sent as a single block.  With ``mute=True`` the
+            printout of the whole block is suppressed using ``/NOPR``.
+
+        Returns
+        -------
+        str
+            Command output from MAPDL.  Empty if the output is muted, or
+            if ``elements`` is empty, in which case nothing is sent to
+            MAPDL.
+
+        Examples
+        --------
+        >>> mapdl.ekill_batch([1, 2, 3, 10, 20, 30])
+
+        """
+        elements = np.asarray(elements).ravel()
+        if not elements.size:
+            return ""
+
+        select, restore = self._select_elements_commands(elements)
+        commands = [*select, "EKILL,ALL", *restore]
+        return self._input_commands(commands, **kwargs)
+
+    def _select_elements_commands(self, elements):
+        """Return the commands to select some elements and to restore the selection.
+
+        The current selection is stored in a temporary component, unless
+        no element is selected, since MAPDL does not create empty
+        components.  In that case the selection is restored with
+        ``ESEL,NONE`` instead.  Both lists of commands must be sent in
+        the same block, as they rely on ``*IF``.
+        """
+        suffix = random_string(5)
+        cm_name = f"__esel_{suffix}__"
+        n_sel = f"__nsel_{suffix}__"
+        select = [
+            f"*GET,{n_sel},ELEM,0,COUNT",
+            f"*IF,{n_sel},GT,0,THEN",
+            f"CM,{cm_name},ELEM",
+            "*ENDIF",
+            "ESEL,NONE",
+        ]
+        select.extend(
+            f"ESEL,A,ELEM,,{vmin},{vmax},{vinc}"
+            for vmin, vmax, vinc in compress_ranges(elements)
+        )
+        restore = [
+            f"*IF,{n_sel},GT,0,THEN",
+            f"CMSEL,S,{cm_name}",
+            f"CMDELE,{cm_name}",
+            "*ELSE",
+            "ESEL,NONE",
+            "*ENDIF",
+            f"{n_sel}=",
+        ]
+        return select, restore
+
+    def _input_commands(self, commands, **kwargs):
+        """Send several commands to MAPDL as a single block.
+
+        The commands are stored using :meth:`run()
+        <ansys.mapdl.core.Mapdl.run>` with ``kwargs`` (for example
+        ``mute``) inside the :attr:`non_interactive
+        <ansys.mapdl.core.Mapdl.non_interactive>` context manager, so
+        they are all sent in one round trip.  If the output is muted, the
+        MAPDL printout of the whole block is also suppressed using
+        ``/NOPR`` and ``/GOPR``, and an empty string is returned.
+        ``None`` is returned if called within the :attr:`non_interactive
+        <ansys.mapdl.core.Mapdl.non_interactive>` context manager.
+        """
+        mute = kwargs.get("mute")
+        if mute is None:
+            mute = getattr(self, "mute", False)
+
+        if mute:
+            # Stored commands skip the /NOPR check done in run()
+            commands = ["/NOPR", *commands, "/GOPR"]
+
+        if self._store_commands:
+            # Already in non-interactive mode, the commands are just stored
+            for command in commands:
+                self.run(command, **kwargs)
+            return None
+
+        with self.non_interactive:
+            for command in commands:
+                self.run(command, **kwargs)
+
+        return "" if mute else self._response
+
     @supress_logging
     def get_array(
         self,
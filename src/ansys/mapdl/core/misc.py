@@ -26,13 +26,14 @@ from functools import cache, wraps
 import importlib
 import inspect
 import os
+import pathlib
 import platform
 import re
 import socket
 import string
 import tempfile
 from threading import Thread
-from typing import Callable, Dict, Iterable, List, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 from warnings import warn
 
 import numpy as np
@@ -415,6 +416,142 @@ def write_array(filename: Union[str, bytes], array: np.ndarray) -> None:
     np.savetxt(filename, array, fmt="%20.12f")
 
 
+def compress_ranges(ids: Iterable[int]) -> List[Tuple[int, int, int]]:
+    """Compress entity numbers into ``(min, max, inc)`` ranges.
+
+    Useful to express a list of entity numbers with the fewest possible
+    MAPDL commands using the ``VMIN, VMAX, VINC`` (or equivalent)
+    arguments.
+
+    Parameters
+    ----------
+    ids : Iterable[int]
+        Entity numbers.  Duplicates are ignored.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]
+        Ranges ``(min, max, inc)`` covering exactly the given numbers.
+
+    Examples
+    --------
+    >>> compress_ranges([1, 2, 3, 4, 10, 20, 30, 31])
+    [(1, 4, 1), (10, 30, 10), (31, 31, 1)]
+    """
+    ids = np.unique(np.asarray(ids, dtype=np.int64).ravel()).tolist()
+
+    ranges = []
+    start = 0
+    n_ids = len(ids)
+    while start < n_ids:
+        end = start
+        if start + 1 < n_ids:
+            inc = ids[start + 1] - ids[start]
+            end = start + 1
+            while end + 1 < n_ids and ids[end + 1] - ids[end] == inc:
+                end += 1
+        else:
+            inc = 1
+
+        ranges.append((ids[start], ids[end], inc))
+        start = end + 1
+
+    return ranges
+
+
+def write_nodes(
+    filename: Union[str, pathlib.Path],
+    nodes: np.ndarray,
+    nnum: Optional[np.ndarray] = None,
+) -> None:
+    """Write nodes to a file using the ``NWRITE`` format.
+
+    The file can be read in MAPDL using ``NREAD``.  Each record is
+    ``NODE, X, Y, Z, THXY, THYZ, THZX`` written with the
+    ``(I8, 6G20.13)`` format documented for ``NWRITE``.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file.
+    nodes : numpy.ndarray
+        Node coordinates with shape ``(n_node, 3)``.
+    nnum : numpy.ndarray, optional
+        Node numbers.  Defaults to ``1, 2, ..., n_node``.
+    """
+    nodes = np.asarray(nodes, dtype=np.float64).reshape(-1, 3)
+    if nnum is None:
+        nnum = np.arange(1, nodes.shape[0] + 1)
+
+    nnum = np.asarray(nnum, dtype=np.int64).ravel()
+    if nnum.shape[0] != nodes.shape[0]:
+        raise ValueError("Arguments 'nodes' and 'nnum' must have the same length.")
+    if nnum.min(initial=1) < 1 or nnum.max(initial=1) >= 10**8:
+        raise ValueError(
+            "Node numbers must be between 1 and 99999999 to fit the NWRITE format."
+        )
+
+    # NWRITE record: NODE, X, Y, Z, THXY, THYZ, THZX
+    data = np.zeros((nodes.shape[0], 7), dtype=np.float64)
+    data[:, 0] = nnum
+    data[:, 1:4] = nodes
+    # 13 significant digits in 20 characters, even with 3-digit exponents
+    np.savetxt(filename, data, fmt="%8d" + "%20.12E" * 6)
+
+
+def write_elements(
+    filename: Union[str, pathlib.Path],
+    elements: np.ndarray,
+    mat: Union[int, np.ndarray] = 1,
+    type_: Union[int, np.ndarray] = 1,
+    real: Union[int, np.ndarray] = 1,
+    secnum: Union[int, np.ndarray] = 1,
+    esys: Union[int, np.ndarray] = 0,
+) -> None:
+    """Write elements to a file using the ``EWRITE`` format.
+
+    The file can be read in MAPDL using ``EREAD``.  Each record is
+    ``I, J, K, L, M, N, O, P, MAT, TYPE, REAL, SECNUM, ESYS, IEL``.
+    The ``SHORT`` format (``14I6``) is used unless any value is too
+    large for it, in which case the ``LONG`` format (``14I8``) is used.
+    A ``ValueError`` is raised if any value does not fit the ``LONG``
+    format either.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file.
+    elements : numpy.ndarray
+        Node numbers with shape ``(n_elem, n_nodes)``, where ``n_nodes``
+        is up to 8.  Unused node positions must be zero.
+    mat, type_, real, secnum, esys : int or numpy.ndarray, optional
+        Element attributes.  Either a single value for all the elements
+        or one value per element.
+    """
+    elements = np.asarray(elements, dtype=np.int64)
+    if elements.ndim != 2 or not 0 < elements.shape[1] <= 8:
+        raise ValueError(
+            "Argument 'elements' must be an array of shape (n_elem, n_nodes) "
+            "with up to 8 nodes per element."
+        )
+
+    n_elem = elements.shape[0]
+    data = np.zeros((n_elem, 14), dtype=np.int64)
+    data[:, : elements.shape[1]] = elements
+    for i, attribute in enumerate([mat, type_, real, secnum, esys]):
+        data[:, 8 + i] = attribute
+    data[:, 13] = np.arange(1, n_elem + 1)
+
+    if data.min(initial=0) < 0 or data.max(initial=0) >= 10**8:
+        raise ValueError(
+            "Node numbers and element attributes must be between 0 and 99999999 "
+            "to fit the EWRITE format."
+        )
+
+    width = 6 if data.max(initial=0) < 10**6 else 8
+    np.savetxt(filename, data, fmt=f"%{width}d" * 14, delimiter="")
+
+
 @cache
 def is_package_installed_cached(package_name):
     try:
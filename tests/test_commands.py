@@ -34,6 +34,7 @@ from ansys.mapdl.core.commands import (
     CommandOutput,
     Commands,
     StringWithLiteralRepr,
+    inject_docs,
 )
 from ansys.mapdl.core.examples.verif_files import vmfiles
 from conftest import TestClass, has_dependency, requires
@@ -283,6 +284,12 @@ def test_docstring_injector(mapdl, cleared, method):
             assert "to_dataframe()" in docstring
 
 
+@pytest.mark.parametrize("docstring", [None, ""])
+def test_docstring_injector_no_docstring(docstring):
+    # Docstrings are None when running Python with ``-OO``
+    assert inject_docs(docstring) == docstring
+
+
 def test_string_with_literal():
     base_ = "asdf\nasdf"
     output = StringWithLiteralRepr(base_)
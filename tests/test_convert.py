@@ -182,6 +182,7 @@ GOLDEN_TESTS = {
     "/show, asdf": 'mapdl.show("asdf")',
     "*STAT,UXFEA2	": 'mapdl.starstatus("UXFEA2")',
     "/AXLAB,X,NORMALIZED TIME,TAU=ALPHA**2*D*t": 'mapdl.axlab("X", "NORMALIZED TIME,TAU=ALPHA**2*D*t")',
+    "K,1,0,0,0 ! FIRST ! KEYPOINT": "mapdl.k(1, 0, 0, 0)  # FIRST   KEYPOINT",
 }
 
 
@@ -600,6 +601,16 @@ myfunc
     assert "myfunc()" in conv_cmd
 
 
+def test_macro_arguments():
+    cmd = """
+*create,myfunc
+aa = ARG1 + ARG10
+*end
+"""
+    conv_cmd = convert_apdl_block(cmd, only_commands=True)
+    assert 'mapdl.run(f"aa = {ARG1} + {ARG10}")' in conv_cmd
+
+
 @pytest.mark.parametrize("mapdl_cmd", GOLDEN_TESTS.keys())
 def test_golden(mapdl_cmd):
     assert GOLDEN_TESTS[mapdl_cmd] == convert_apdl_block(mapdl_cmd, only_commands=True)
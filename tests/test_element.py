@@ -25,7 +25,7 @@ import numpy as np
 import pytest
 
 from ansys.mapdl.core import examples
-from ansys.mapdl.core._commands.parse import parse_e, parse_et
+from ansys.mapdl.core._commands.parse import parse_e, parse_e_many, parse_et
 from conftest import TestClass, requires
 
 
@@ -47,6 +47,230 @@ def test_e(mapdl, cleared):
     assert e1 == 2
 
 
+def test_e_batch(mapdl, cleared):
+    mapdl.et("", 183)
+    nodes = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1], [0, 1, -1]]
+    nnum = mapdl.n_batch(nodes)
+    assert nnum == [1, 2, 3, 4, 5]
+    assert np.allclose(mapdl.mesh.nodes, nodes)
+
+    enum = mapdl.e_batch([[1, 2, 3, 4], [1, 2, 3, 5]])
+    assert enum == [1, 2]
+    assert mapdl.mesh.n_elem == 2
+
+
+@requires("scipy")
+@pytest.mark.parametrize("tlab,expected", [("LOW", [1, 3]), ("HIGH", [3, 1])])
+def test_eintf_batch(mapdl, cleared, tlab, expected):
+    mapdl.et(1, "COMBIN14")
+    mapdl.n_batch([[0, 0, 0], [1, 0, 0], [0, 0, 0], [1, 0, 0], [0, 0, 1e-5]])
+    assert mapdl.eintf_batch(tlab=tlab) == [1, 2, 3]
+    assert mapdl.mesh.n_elem == 3
+    assert np.allclose(mapdl.mesh.elem[0][-2:], expected)
+
+
+@requires("scipy")
+def test_eintf_batch_chained(mapdl, cleared):
+    # 1-2 and 2-3 are within the tolerance, but 1-3 is not
+    mapdl.et(1, "COMBIN14")
+    mapdl.n_batch([[0, 0, 0], [0.6e-4, 0, 0], [1.2e-4, 0, 0]])
+    assert mapdl.eintf_batch(toler=1e-4) == [1, 2]
+    assert np.allclose([each[-2:] for each in mapdl.mesh.elem], [[1, 2], [1, 3]])
+
+
+@requires("scipy")
+def test_enorm_batch(mapdl, cleared):
+    mapdl.et(1, "SHELL181")
+    mapdl.n_batch(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]]
+        + [[0, 0, 5], [1, 0, 5], [1, 1, 5], [0, 1, 5], [2, 0, 5], [2, 1, 5]]
+    )
+    # Two disjoint panels, each with one flipped element
+    mapdl.e_batch([[1, 2, 3, 4], [3, 6, 5, 2], [7, 8, 9, 10], [9, 12, 11, 8]])
+
+    mapdl.enorm_batch()
+
+    nodes = mapdl.mesh.nodes
+    areas = []
+    for each in mapdl.mesh.elem:
+        xy = nodes[each[10:14] - 1, :2]
+        x, y = xy[:, 0], xy[:, 1]
+        areas.append(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+    assert np.all(np.sign(areas) == 1)
+
+
+@requires("scipy")
+def test_enorm_batch_no_selection(mapdl, cleared):
+    assert mapdl.enorm_batch() == ""
+
+
+def test_e_batch_enum(mapdl, cleared):
+    mapdl.et("", 183)
+    mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1], [0, 1, -1]])
+
+    enum = mapdl.e_batch([[1, 2, 3, 4], [1, 2, 3, 5]], enum=[10, 20])
+    assert enum == [10, 20]
+    assert np.allclose(mapdl.mesh.enum, [10, 20])
+
+
+def test_e_batch_invalid(mapdl, cleared):
+    with pytest.raises(ValueError, match="up to 8 nodes"):
+        mapdl.e_batch(np.ones((2, 9), dtype=np.int32))
+
+    with pytest.raises(ValueError, match="same number of rows"):
+        mapdl.e_batch([[1, 2, 3, 4], [1, 2, 3, 5]], enum=[1])
+
+
+def test_batch_empty(mapdl, cleared):
+    mapdl.et("", 183)
+    mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1]])
+    mapdl.e_batch([[1, 2, 3, 4]])
+
+    # The output of the previous commands must not be returned
+    assert mapdl.n_batch([]) == []
+    assert mapdl.e_batch(np.empty((0, 4))) == []
+    assert mapdl.emodif_batch([], "MAT", []) == ""
+    assert mapdl.mesh.n_node == 4
+    assert mapdl.mesh.n_elem == 1
+
+
+def test_load_nodes_and_elements(mapdl, cleared):
+    mapdl.et(1, "SHELL181")
+    nodes = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]]
+    mapdl.load_nodes(nodes)
+    assert mapdl.mesh.n_node == 6
+    assert np.allclose(mapdl.mesh.nodes, nodes)
+
+    mapdl.load_elements([[1, 2, 3, 4], [2, 5, 6, 3]], mat=[1, 2])
+    assert mapdl.mesh.n_elem == 2
+    assert np.allclose(mapdl.mesh.material_type, [1, 2])
+
+
+def test_emodif_batch(mapdl, cleared):
+    mapdl.block(0, 1, 0, 1, 0, 1)
+    mapdl.et(1, "SOLID186")
+    mapdl.esize(0.5)
+    mapdl.vmesh("ALL")
+    mapdl.emodif_batch([1, 2, 3], "MAT", [2, 3, 4])
+
+    mapdl.esel("S", "MAT", "", 2, 4)
+    assert mapdl.mesh.n_elem == 3
+
+
+def test_emodif_batch_mute(mapdl, cleared):
+    mapdl.block(0, 1, 0, 1, 0, 1)
+    mapdl.et(1, "SOLID186")
+    mapdl.esize(0.5)
+    mapdl.vmesh("ALL")
+    assert mapdl.emodif_batch([1, 2], "MAT", [2, 2], mute=True) == ""
+
+    mapdl.esel("S", "MAT", "", 2)
+    assert mapdl.mesh.n_elem == 2
+
+
+def test_ekill_batch(mapdl, cleared):
+    mapdl.block(0, 1, 0, 1, 0, 1)
+    mapdl.et(1, "SOLID186")
+    mapdl.esize(0.5)
+    mapdl.vmesh("ALL")
+    mapdl.esel("S", "ELEM", "", 1, 7)
+    mapdl.ekill_batch([1, 2, 3, 5])
+
+    # selection is restored
+    assert mapdl.mesh.n_elem == 7
+
+    mapdl.esel("S", "LIVE")
+    assert mapdl.mesh.n_elem == 4
+
+
+def test_ekill_batch_mute(mapdl, cleared):
+    mapdl.block(0, 1, 0, 1, 0, 1)
+    mapdl.et(1, "SOLID186")
+    mapdl.esize(0.5)
+    mapdl.vmesh("ALL")
+    assert mapdl.ekill_batch([1, 2], mute=True) == ""
+
+    # The printout is restored after the block
+    assert mapdl.esel("S", "LIVE")
+    assert mapdl.mesh.n_elem == 6
+
+
+def test_ekill_batch_no_selection(mapdl, cleared):
+    mapdl.block(0, 1, 0, 1, 0, 1)
+    mapdl.et(1, "SOLID186")
+    mapdl.esize(0.5)
+    mapdl.vmesh("ALL")
+    mapdl.esel("NONE")
+    mapdl.ekill_batch([1, 2])
+
+    # the empty selection is restored
+    assert mapdl.mesh.n_elem == 0
+
+    mapdl.esel("S", "LIVE")
+    assert mapdl.mesh.n_elem == 6
+
+
+def test_ekill_batch_empty(mapdl, cleared):
+    mapdl.block(0, 1, 0, 1, 0, 1)
+    mapdl.et(1, "SOLID186")
+    mapdl.esize(0.5)
+    mapdl.vmesh("ALL")
+    assert mapdl.ekill_batch([]) == ""
+
+    mapdl.esel("S", "LIVE")
+    assert mapdl.mesh.n_elem == 8
+
+
+@pytest.mark.parametrize(
+    "elements", [[1, 2, 3, 5], (5, 3, 2, 1), {1, 2, 3, 5}, np.array([1, 2, 3, 5])]
+)
+def test_edele_iterable(mapdl, cleared, elements):
+    mapdl.et("", 183)
+    mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1]])
+    mapdl.e_batch([[1, 2, 3, 4]] * 6)
+    assert mapdl.mesh.n_elem == 6
+
+    mapdl.edele(elements)
+    assert mapdl.mesh.n_elem == 2
+
+
+def test_edele_iterable_mute(mapdl, cleared):
+    mapdl.et("", 183)
+    mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1]])
+    mapdl.e_batch([[1, 2, 3, 4]] * 3)
+
+    assert mapdl.edele([1, 3], mute=True) == ""
+    assert mapdl.mesh.n_elem == 1
+
+
+def test_edele_iterable_non_interactive(mapdl, cleared):
+    mapdl.et("", 183)
+    mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1]])
+    mapdl.e_batch([[1, 2, 3, 4]] * 3)
+
+    with mapdl.non_interactive:
+        assert mapdl.edele([1, 3]) is None
+        mapdl.edele(2)
+
+    assert mapdl.mesh.n_elem == 0
+
+
+@pytest.mark.parametrize("elements", [[], (), set(), np.array([], dtype=int)])
+def test_edele_iterable_empty(mapdl, cleared, elements):
+    mapdl.et("", 183)
+    mapdl.n_batch([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1]])
+    mapdl.e_batch([[1, 2, 3, 4]])
+
+    assert mapdl.edele(elements) == ""
+    assert mapdl.mesh.n_elem == 1
+
+
+def test_edele_iterable_invalid(mapdl, cleared):
+    with pytest.raises(ValueError, match="not allowed to use 'iel2' or 'inc'"):
+        mapdl.edele([1, 2, 3], 10)
+
+
 def test_et(mapdl, cleared):
     n_plane183 = mapdl.et("", "PLANE183")
     assert n_plane183 == 1
@@ -167,6 +391,18 @@ class TestParseElementCommands(TestClass):
         response = parse_e(message[0])
         assert response is None
 
+    @pytest.mark.parametrize(
+        "message",
+        [
+            ("ELEMENT 8\nELEMENT 9\nELEMENT 10", [8, 9, 10]),
+            ("ELEMENT TYPE 1 IS SOLID186\nELEMENT 1", [1]),
+            ("other thing entirely", []),
+            (None, None),
+        ],
+    )
+    def test_parse_e_many(self, message):
+        assert parse_e_many(message[0]) == message[1]
+
     @pytest.mark.parametrize(
         "message",
         [
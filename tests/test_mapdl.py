@@ -58,6 +58,7 @@ from ansys.mapdl.core.errors import (
     MapdlRuntimeError,
 )
 from ansys.mapdl.core.launcher import launch_mapdl
+from ansys.mapdl.core.mapdl_core import parse_to_short_cmd
 from ansys.mapdl.core.mapdl_grpc import SESSION_ID_NAME
 from ansys.mapdl.core.misc import random_string, stack
 from conftest import IS_SMP, ON_CI, ON_LOCAL, QUICK_LAUNCH_SWITCHES, requires
@@ -473,6 +474,18 @@ def test_chaining(mapdl, cleared):
         assert mapdl.geometry.n_keypoint == 1000
 
 
+def test_chaining_no_commands(mapdl, cleared):
+    if mapdl._distributed:
+        pytest.skip("Chained commands are not permitted in distributed ansys.")
+
+    with patch.object(mapdl, "_run") as mock_run:
+        with mapdl.chain_commands:
+            pass
+
+    mock_run.assert_not_called()
+    assert mapdl.last_response == ""
+
+
 def test_error(mapdl, cleared):
     with pytest.raises(MapdlRuntimeError):
         mapdl.a(0, 0, 0, 0)
@@ -1161,6 +1174,21 @@ def test_inval_commands(mapdl, cleared, each_cmd):
         mapdl.run(each_cmd)
 
 
+@pytest.mark.parametrize(
+    "command,short_cmd",
+    [
+        ("K,,1,0,0,", "K"),
+        ("VPLOT, ALL", "VPLO"),
+        ("/nopr", "/NOP"),
+        ("n,1", "N"),
+        ("eplo", "EPLO"),
+        ("", ""),
+    ],
+)
+def test_parse_to_short_cmd(command, short_cmd):
+    assert parse_to_short_cmd(command) == short_cmd
+
+
 def test_inval_commands_silent(mapdl, tmpdir, cleared):
     assert mapdl.run("parm = 'asdf'")  # assert it is not empty
     mapdl.nopr()
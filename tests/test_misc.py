@@ -31,12 +31,15 @@ from ansys.mapdl.core.misc import (
     check_valid_ip,
     check_valid_port,
     check_valid_routine,
+    compress_ranges,
     create_temp_dir,
     last_created,
     load_file,
     no_return,
     requires_package,
     run_as,
+    write_elements,
+    write_nodes,
 )
 from conftest import requires
 
@@ -272,3 +275,80 @@ def test_create_temp_dir():
     dir_ = path.parts[-1]
 
     assert str(path) != create_temp_dir(parent, dir_)
+
+
+@pytest.mark.parametrize(
+    "ids,ranges",
+    [
+        ([1, 2, 3, 4, 10, 20, 30, 31], [(1, 4, 1), (10, 30, 10), (31, 31, 1)]),
+        ([3, 1, 2, 2], [(1, 3, 1)]),
+        ([5], [(5, 5, 1)]),
+        ([1, 5], [(1, 5, 4)]),
+        ([], []),
+    ],
+)
+def test_compress_ranges(ids, ranges):
+    assert compress_ranges(ids) == ranges
+
+
+def test_write_nodes(tmpdir):
+    filename = str(tmpdir.join("nodes.node"))
+    write_nodes(filename, [[0, 0, 0], [1.5, 2, -3e-5]], nnum=[10, 20])
+
+    # (I8, 6G20.13) records
+    with open(filename) as fid:
+        lines = fid.read().splitlines()
+
+    assert all(len(line) == 8 + 6 * 20 for line in lines)
+    assert lines[1][:8] == "      20"
+    assert float(lines[1][48:68]) == -3e-5
+
+    data = np.loadtxt(filename)
+    assert np.allclose(data[:, 0], [10, 20])
+    assert np.allclose(data[:, 1:4], [[0, 0, 0], [1.5, 2, -3e-5]])
+    assert np.allclose(data[:, 4:], 0)
+
+
+@pytest.mark.parametrize("nnum", [[1, 10**8], [0, 1]])
+def test_write_nodes_invalid(tmpdir, nnum):
+    with pytest.raises(ValueError, match="NWRITE format"):
+        write_nodes(str(tmpdir.join("nodes.node")), np.zeros((2, 3)), nnum=nnum)
+
+
+def test_write_elements(tmpdir):
+    filename = str(tmpdir.join("elements.elem"))
+    write_elements(filename, [[1, 2, 3, 4], [2, 3, 4, 5]], mat=[1, 2])
+
+    with open(filename) as fid:
+        lines = fid.read().splitlines()
+
+    assert all(len(line) == 14 * 6 for line in lines)
+    data = np.loadtxt(filename, dtype=np.int64)
+    assert np.allclose(data[:, :4], [[1, 2, 3, 4], [2, 3, 4, 5]])
+    assert np.allclose(data[:, 4:8], 0)
+    assert np.allclose(data[:, 8], [1, 2])
+    assert np.allclose(data[:, 13], [1, 2])
+
+
+def test_write_elements_long_format(tmpdir):
+    filename = str(tmpdir.join("elements.elem"))
+    write_elements(filename, [[1, 2, 3, 1000000]])
+
+    with open(filename) as fid:
+        assert len(fid.readline().rstrip("\n")) == 14 * 8
+
+
+def test_write_elements_invalid(tmpdir):
+    with pytest.raises(ValueError, match="up to 8 nodes"):
+        write_elements(str(tmpdir.join("elements.elem")), np.ones((2, 9)))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"mat": 10**8}, {"type_": 10**8}, {"real": [1, 10**9]}, {"mat": -1}],
+)
+def test_write_elements_too_wide(tmpdir, kwargs):
+    with pytest.raises(ValueError, match="EWRITE format"):
+        write_elements(
+            str(tmpdir.join("elements.elem")), [[1, 2, 3, 4], [2, 3, 4, 5]], **kwargs
+        )
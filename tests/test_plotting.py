@@ -280,6 +280,17 @@ def test_eplot(mapdl, make_block, vtk):
     assert mapdl.mesh.n_elem == init_elem
 
 
+def test_eplot_selection(mapdl, make_block):
+    mapdl.eplot(vtk=True)
+    n_cells = mapdl.mesh._surf.n_cells
+
+    # the cached surface must follow the element selection
+    mapdl.esel("S", "ELEM", "", 1)
+    mapdl.eplot(vtk=True)
+    assert mapdl.mesh._surf.n_cells < n_cells
+    mapdl.allsel()
+
+
 def test_eplot_savefig(mapdl, make_block, tmpdir):
     filename = str(tmpdir.mkdir("tmpdir").join("tmp.png"))
     mapdl.eplot(